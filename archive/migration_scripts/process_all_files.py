@@ -1,92 +1,125 @@
 import csv
 import os
+import random
+import sys
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 
 # Paths
-base_dir = r"c:\Users\USER\Desktop\OSS\BoardGameRent\dullgboardgamerent\db_seeds"
-games_path = os.path.join(base_dir, "raw_games.csv")
-rentals_path = os.path.join(base_dir, "rentals.csv")
-reviews_path = os.path.join(base_dir, "reviews.csv")
-
-# 1. Read Games and Build Map
-games = []
-id_map = {} # old_id_str -> new_id_str
-
-with open(games_path, 'r', encoding='utf-8-sig') as f:
-    reader = csv.DictReader(f)
-    game_fieldnames = reader.fieldnames
-    print(f"Keys found: {game_fieldnames}")
-    for row in reader:
-        games.append(row)
-
-# Determine Next ID
-max_id = 0
-for row in games:
-    try:
-        pid = int(row['id'])
-        print(f"Checking ID: {pid}") # Debug
-        if pid < 10000: # Standard IDs
-            if pid > max_id:
+base_dir = os.path.join(ROOT_DIR, "db_seeds")
+
+
+def add_arguments(parser):
+    parser.add_argument("--seeds-dir", default=base_dir, help="raw_games.csv / rentals.csv / reviews.csv 위치")
+    parser.add_argument("--random", action="store_true", help="순번 대신 랜덤 int8 ID로 전체 재부여")
+    parser.add_argument("--seed", type=int, default=None, help="--random 사용 시 난수 시드 (재현용)")
+
+
+def sequential_ids(games):
+    """Standard IDs (< 10000) are kept; large / non-integer IDs are renumbered after the max."""
+    id_map = {} # old_id_str -> new_id_str
+
+    # Determine Next ID
+    max_id = 0
+    for row in games:
+        try:
+            pid = int(row['id'])
+            if pid < 10000 and pid > max_id: # Standard IDs
                 max_id = pid
-    except:
-        pass
-
-next_id = max_id + 1
-print(f"Starting renumbering from ID: {next_id}")
-
-# Renumber Games
-for row in games:
-    original_id = row['id']
-    try:
-        pid = int(original_id)
-        if pid >= 10000:
-            new_id = str(next_id)
-            id_map[original_id] = new_id
-            row['id'] = new_id
-            next_id += 1
-    except:
-        # Non-integer IDs
-        new_id = str(next_id)
-        id_map[original_id] = new_id
-        row['id'] = new_id
+        except ValueError:
+            pass
+
+    next_id = max_id + 1
+    print(f"Starting renumbering from ID: {next_id}")
+
+    for row in games:
+        original_id = row['id']
+        try:
+            if int(original_id) < 10000:
+                continue
+        except ValueError:
+            pass # Non-integer IDs
+        id_map[original_id] = str(next_id)
         next_id += 1
+    return id_map
 
-# 2. Process Rentals (Update game_id)
-rentals = []
-with open(rentals_path, 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    rental_fieldnames = reader.fieldnames
-    for row in reader:
-        gid = row['game_id']
-        if gid in id_map:
-            row['game_id'] = id_map[gid]
-        rentals.append(row)
-
-# 3. Process Reviews (Update game_id)
-reviews = []
-with open(reviews_path, 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    review_fieldnames = reader.fieldnames
-    for row in reader:
+
+def random_ids(games, seed=None):
+    """Every game gets a unique random ID (int8)."""
+    # Range: up to 12 digits -> Fits comfortably in BigInt (max 9e18)
+    # Also using a set to ensure uniqueness (though extremely unlikely to collide)
+    rng = random.Random(seed)
+    id_map = {} # old_id_str -> new_id_str (int8 random)
+    used_ids = set()
+
+    for row in games:
+        while True:
+            new_id_int = rng.randint(100000, 999999999999)
+            if new_id_int not in used_ids:
+                used_ids.add(new_id_int)
+                break
+        id_map[row['id']] = str(new_id_int)
+    return id_map
+
+
+def read_csv(path, encoding='utf-8'):
+    with open(path, 'r', encoding=encoding) as f:
+        reader = csv.DictReader(f)
+        return reader.fieldnames, list(reader)
+
+
+def write_csv(path, fieldnames, rows):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def remap_game_ids(rows, id_map):
+    updated = 0
+    for row in rows:
         gid = row['game_id']
         if gid in id_map:
             row['game_id'] = id_map[gid]
-        reviews.append(row)
-
-# 4. Save All Files
-with open(games_path, 'w', encoding='utf-8', newline='') as f:
-    writer = csv.DictWriter(f, fieldnames=game_fieldnames)
-    writer.writeheader()
-    writer.writerows(games)
-
-with open(rentals_path, 'w', encoding='utf-8', newline='') as f:
-    writer = csv.DictWriter(f, fieldnames=rental_fieldnames)
-    writer.writeheader()
-    writer.writerows(rentals)
-
-with open(reviews_path, 'w', encoding='utf-8', newline='') as f:
-    writer = csv.DictWriter(f, fieldnames=review_fieldnames)
-    writer.writeheader()
-    writer.writerows(reviews)
-
-print(f"Renumbered {len(id_map)} items.")
-print(f"Mapping applied to Rentals and Reviews.")
+            updated += 1
+    return updated
+
+
+def run(args, config):
+    games_path = os.path.join(args.seeds_dir, "raw_games.csv")
+    rentals_path = os.path.join(args.seeds_dir, "rentals.csv")
+    reviews_path = os.path.join(args.seeds_dir, "reviews.csv")
+
+    # 1. Read Games and Build Map (utf-8-sig to handle BOM if present)
+    game_fieldnames, games = read_csv(games_path, encoding='utf-8-sig')
+    print(f"Total Games found: {len(games)}")
+
+    id_map = random_ids(games, args.seed) if args.random else sequential_ids(games)
+    for row in games:
+        if row['id'] in id_map:
+            row['id'] = id_map[row['id']]
+
+    # 2. Process Rentals / Reviews (Update game_id)
+    rental_fieldnames, rentals = read_csv(rentals_path)
+    rentals_updated = remap_game_ids(rentals, id_map)
+    review_fieldnames, reviews = read_csv(reviews_path)
+    reviews_updated = remap_game_ids(reviews, id_map)
+
+    print(f"Renumbered {len(id_map)} items.")
+    print(f"Updated {rentals_updated} rentals and {reviews_updated} reviews references.")
+    if args.dry_run:
+        print("[dry-run] 파일 저장 생략")
+        return 0
+
+    # 3. Save All Files
+    write_csv(games_path, game_fieldnames, games)
+    write_csv(rentals_path, rental_fieldnames, rentals)
+    write_csv(reviews_path, review_fieldnames, reviews)
+    print("Mapping applied to Rentals and Reviews.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.join(ROOT_DIR, "scripts"))
+    from tool_config import standalone
+    sys.exit(standalone("게임 ID 재부여 후 rentals / reviews 참조 갱신", add_arguments, run))
@@ -1,11 +1,21 @@
 
 import csv
+import os
+import sys
 from datetime import datetime
-import re
 
-input_path = r"c:\Users\USER\Desktop\OSS\BoardGameRent\dullgboardgamerent\archive\DullG_BoardGame_Rental - Logs (1).csv"
-rentals_output_path = r"c:\Users\USER\Desktop\OSS\BoardGameRent\dullgboardgamerent\db_seeds\rentals.csv"
-stats_output_path = r"c:\Users\USER\Desktop\OSS\BoardGameRent\dullgboardgamerent\archive\history_stats.csv"
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+input_path = os.path.join(ROOT_DIR, "archive", "DullG_BoardGame_Rental - Logs (1).csv")
+rentals_output_path = os.path.join(ROOT_DIR, "db_seeds", "rentals.csv")
+stats_output_path = os.path.join(ROOT_DIR, "archive", "history_stats.csv")
+
+
+def add_arguments(parser):
+    parser.add_argument("--input", default=input_path, help="구 시트 Logs CSV 경로")
+    parser.add_argument("--rentals-output", default=rentals_output_path, help="rentals 시드 CSV 저장 경로")
+    parser.add_argument("--stats-output", default=stats_output_path, help="조회수 통계 CSV 저장 경로")
+
 
 def parse_custom_date(date_str):
     # Format: "2025. 12. 2. 오전 2:07:19" or "2025. 12. 26. PM 1:17:03"
@@ -19,24 +29,24 @@ def parse_custom_date(date_str):
         hour = int(time_parts[0])
         minute = int(time_parts[1])
         second = int(time_parts[2])
-        
+
         if ampm in ['PM', '오후'] and hour < 12:
             hour += 12
         elif ampm in ['AM', '오전'] and hour == 12:
             hour = 0
-            
+
         return datetime(year, month, day, hour, minute, second).isoformat()
     except Exception as e:
         # Fallback: try standard parsing or return original if just a string check
         return None
 
-def process_logs():
+def run(args, config):
     view_counts = {}
     rentals = []
 
-    with open(input_path, 'r', encoding='utf-8') as f:
+    with open(args.input, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
-        
+
         for row in reader:
             action = row['action_type']
             game_id = row['game_id']
@@ -44,24 +54,24 @@ def process_logs():
             # 로그 샘플: log_..., 2, RENT, 5ae49... (user_id?), 2025..., 22222222 (학번?)
             # user_id 컬럼: 22학번 김범근, Admin, Anonymous 등
             # value 컬럼: DIBS일때 '4'(인원?), RENT일때 '대여중' 또는 UUID 등 다양함
-            
+
             # 1. VIEW 집계
             if action == 'VIEW':
                 if game_id not in view_counts:
                     view_counts[game_id] = 0
                 view_counts[game_id] += 1
-            
+
             # 2. RENT 이력 추출
             elif action == 'RENT':
                 # 과거 데이터 복원용이라 완벽하진 않지만 최대한 정보 수집
                 # user_id 컬럼에 있는게 실제 빌려간 사람일 확률 높음 (Admin이 처리했으면 Admin일수도 있지만)
                 # 로그 샘플 503: user_id='Admin', value='admin' (빌린사람?), timestamp=...
-                
+
                 borrower = row['user_id']
                 # 만약 user_id가 Admin이면 value나 다른 곳에서 정보 찾아야 함.
-                # 일단은 단순하게 row 그대로 저장해서 나중에 수동 매핑하거나, 
+                # 일단은 단순하게 row 그대로 저장해서 나중에 수동 매핑하거나,
                 # user_id 컬럼을 borrower로 가정.
-                
+
                 if user_id in ['Admin', 'admin'] or not user_id:
                      user_id = 'UNKNOWN_ADMIN' # Fallback
 
@@ -69,26 +79,34 @@ def process_logs():
                 if iso_date:
                     rentals.append({
                         'game_id': game_id,
-                        'user_id': borrower, 
+                        'user_id': borrower,
                         'borrowed_at': iso_date,
                         'status': 'RETURNED'
                     })
 
+    print(f"VIEW 집계: {len(view_counts)}개 게임, RENT 이력: {len(rentals)}건")
+    if args.dry_run:
+        print("[dry-run] 파일 저장 생략")
+        return 0
+
     # 1. Stats CSV 저장
-    with open(stats_output_path, 'w', encoding='utf-8', newline='') as f:
+    with open(args.stats_output, 'w', encoding='utf-8', newline='') as f:
         writer = csv.writer(f)
         writer.writerow(['game_id', 'view_count'])
         for gid, count in view_counts.items():
             writer.writerow([gid, count])
 
     # 2. Rentals CSV 저장
-    with open(rentals_output_path, 'w', encoding='utf-8', newline='') as f:
+    with open(args.rentals_output, 'w', encoding='utf-8', newline='') as f:
         writer = csv.DictWriter(f, fieldnames=['game_id', 'user_id', 'borrowed_at', 'status'])
         writer.writeheader()
         writer.writerows(rentals)
 
-    print(f"Stats saved to: {stats_output_path}")
-    print(f"Rentals saved to: {rentals_output_path}")
+    print(f"Stats saved to: {args.stats_output}")
+    print(f"Rentals saved to: {args.rentals_output}")
+    return 0
 
 if __name__ == "__main__":
-    process_logs()
+    sys.path.insert(0, os.path.join(ROOT_DIR, "scripts"))
+    from tool_config import standalone
+    sys.exit(standalone("구 시트 Logs CSV → rentals / 조회수 통계", add_arguments, run))
@@ -1,11 +1,20 @@
 from datetime import datetime
 import csv
+import os
+import sys
 
-input_path = r"c:\Users\USER\Desktop\OSS\BoardGameRent\dullgboardgamerent\archive\DullG_BoardGame_Rental - Reviews.csv"
-output_path = r"c:\Users\USER\Desktop\OSS\BoardGameRent\dullgboardgamerent\db_seeds\reviews.csv"
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+input_path = os.path.join(ROOT_DIR, "archive", "DullG_BoardGame_Rental - Reviews.csv")
+output_path = os.path.join(ROOT_DIR, "db_seeds", "reviews.csv")
 
 target_author = "오세인"
 
+def add_arguments(parser):
+    parser.add_argument("--input", default=input_path, help="구 시트 Reviews CSV 경로")
+    parser.add_argument("--output", default=output_path, help="reviews 시드 CSV 저장 경로")
+    parser.add_argument("--author", default=target_author, help=f"추출할 작성자 (기본: {target_author})")
+
 def parse_custom_date(date_str):
     # Format: "2025. 12. 26. PM 1:17:03"
     try:
@@ -32,19 +41,19 @@ def parse_custom_date(date_str):
         print(f"Date parsing failed for {date_str}: {e}")
         return None
 
-def process_reviews():
+def run(args, config):
     filtered_reviews = []
     
     # 헤더에 마지막 컬럼(timestamp) 이름이 었어서 명시적으로 지정
     headers = ['review_id','game_id','user_name','password','rating','comment','timestamp']
     
-    with open(input_path, 'r', encoding='utf-8') as f:
+    with open(args.input, 'r', encoding='utf-8') as f:
         # 첫 줄(헤더) 건너뛰기
         next(f)
         reader = csv.DictReader(f, fieldnames=headers)
         
         for row in reader:
-            if row['user_name'] == target_author:
+            if row['user_name'] == args.author:
                 iso_date = parse_custom_date(row['timestamp'])
                 if iso_date:
                     filtered_reviews.append({
@@ -55,13 +64,21 @@ def process_reviews():
                         'created_at': iso_date
                     })
 
-    with open(output_path, 'w', encoding='utf-8', newline='') as f:
+    print(f"'{args.author}' 리뷰 {len(filtered_reviews)}건")
+    if args.dry_run:
+        print("[dry-run] 파일 저장 생략")
+        return 0
+
+    with open(args.output, 'w', encoding='utf-8', newline='') as f:
         fieldnames = ['game_id', 'author_name', 'rating', 'content', 'created_at']
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         writer.writerows(filtered_reviews)
 
-    print(f"Filtered reviews for '{target_author}' saved to: {output_path}")
+    print(f"Filtered reviews for '{args.author}' saved to: {args.output}")
+    return 0
 
 if __name__ == "__main__":
-    process_reviews()
+    sys.path.insert(0, os.path.join(ROOT_DIR, "scripts"))
+    from tool_config import standalone
+    sys.exit(standalone("구 시트 Reviews CSV → reviews 시드", add_arguments, run))
@@ -1,13 +1,21 @@
 
 import csv
+import os
+import sys
 
-input_path = r"c:\Users\USER\Desktop\OSS\BoardGameRent\dullgboardgamerent\csv 파일들\DullG_BoardGame_Rental - Users.csv"
-output_path = r"c:\Users\USER\Desktop\OSS\BoardGameRent\dullgboardgamerent\csv 파일들\allowed_users.csv"
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 
-def process_users():
+input_path = os.path.join(ROOT_DIR, "archive", "DullG_BoardGame_Rental - Users.csv")
+output_path = os.path.join(ROOT_DIR, "db_seeds", "allowed_users.csv")
+
+def add_arguments(parser):
+    parser.add_argument("--input", default=input_path, help="구 시트 Users CSV 경로")
+    parser.add_argument("--output", default=output_path, help="allowed_users 시드 CSV 저장 경로")
+
+def run(args, config):
     allowed_users = []
     
-    with open(input_path, 'r', encoding='utf-8') as f:
+    with open(args.input, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
         
         for row in reader:
@@ -20,13 +28,21 @@ def process_users():
                 'joined_semester': '2025-1' # 기본값
             })
 
-    with open(output_path, 'w', encoding='utf-8', newline='') as f:
+    print(f"허용 사용자 {len(allowed_users)}명")
+    if args.dry_run:
+        print("[dry-run] 파일 저장 생략")
+        return 0
+
+    with open(args.output, 'w', encoding='utf-8', newline='') as f:
         fieldnames = ['student_id', 'name', 'phone', 'role', 'joined_semester']
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         writer.writerows(allowed_users)
 
-    print(f"Allowed users saved to: {output_path}")
+    print(f"Allowed users saved to: {args.output}")
+    return 0
 
 if __name__ == "__main__":
-    process_users()
+    sys.path.insert(0, os.path.join(ROOT_DIR, "scripts"))
+    from tool_config import standalone
+    sys.exit(standalone("구 시트 Users CSV → allowed_users 시드", add_arguments, run))
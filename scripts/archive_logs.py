@@ -0,0 +1,444 @@
+"""
+logs 테이블 월 단위 아카이브 / 컴팩션 도구
+
+- 마감된 달(이번 달 이전, 한국 시간 기준)의 logs를 archive/logs/YYYY-MM.jsonl.gz 로 옮깁니다.
+- details(jsonb 객체 또는 "Copy:415, RentID:..." 같은 문자열)를
+  copy_id / rental_id / request_id / actor 컬럼으로 파싱합니다.
+- index.json 에 game_id / user_id 별 파티션 목록을 기록해서,
+  lookup 시 해당 파티션만 읽습니다.
+
+사용 예:
+    python scripts/dullg.py archive-logs archive --input database/standard_dump/logs.json
+    python scripts/dullg.py archive-logs archive --from-db --purge
+    python scripts/dullg.py archive-logs compact --jobs 4
+    python scripts/dullg.py archive-logs lookup --game 3
+"""
+
+import gzip
+import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import tool_config
+
+DEFAULT_ARCHIVE_DIR = os.path.join(tool_config.ROOT_DIR, "archive", "logs")
+INDEX_FILE = "index.json"
+PAGE_SIZE = 1000  # Supabase 기본 응답 상한
+# in.(...) 필터는 URL 쿼리스트링에 실림 → UUID 1000개(~37KB)면 414 URI Too Long 위험
+DELETE_CHUNK_SIZE = 150
+# 월 경계는 한국 시간 기준 (Asia/Seoul은 서머타임이 없어 고정 +09:00과 동일,
+# Windows에서 tzdata 패키지 없이도 동작하도록 zoneinfo 대신 고정 오프셋 사용)
+KST = timezone(timedelta(hours=9), "KST")
+
+# 파티션 파일의 컬럼 순서 (details 원문은 복원을 위해 그대로 보존)
+COLUMNS = [
+    "log_id", "game_id", "user_id", "action_type",
+    "copy_id", "rental_id", "request_id", "actor", "details", "created_at",
+]
+
+# [details 포맷]
+# 현재 RPC (database/_LIVE/functions.sql) → jsonb 객체
+#   {"action": "ADMIN RENT", "renter": "김범근"}                (RENT, 관리자 대여)
+#   {"message": "7일 기한 연장", "days": 7, "renter": "..."}     (EXTEND)
+#   {"request_id": "<uuid>", "hold_count": 2}                  (RENTAL_REQUEST_CONFIRM)
+#   {"request_id": "<uuid>", "status": ..., "matched": ...}    (RENTAL_REQUEST_INGEST)
+#   "User reserved game", "Kiosk Pickup", "Return: User" ...  (고정 문자열 → 파싱 대상 없음)
+# 구 RPC / 덤프 데이터 → 문자열
+#   "Copy:415, RentID:<uuid>"            (DIBS)
+#   "CopyID:415"                         (DIBS)
+#   "Kiosk Pickup (Rental ID: <uuid>)"   (RENT)
+#   "ADMIN Direct, RentID:<uuid>, Name:김범근"
+#   "ADMIN: 김범근"                       (RENT / RETURN)
+#   "ADMIN RENT: 김범근", "Rental: 홍길동" (RENT, 중간 마이그레이션 버전)
+COPY_RE = re.compile(r"Copy(?:ID)?\s*:\s*(\d+)")
+RENTAL_RE = re.compile(r"(?:RentID|Rental ID)\s*:\s*([0-9a-fA-F-]{36})")
+NAME_RE = re.compile(r"Name\s*:\s*([^,]+)")
+ACTOR_RE = re.compile(r"^(?:ADMIN(?: RENT)?|Rental):\s*(.+)$")
+
+
+def parse_details(details):
+    """details에서 (copy_id, rental_id, request_id, actor)를 추출합니다. 없으면 None."""
+    if isinstance(details, dict):
+        copy_id = details.get("copy_id")
+        rental_id = details.get("rental_id")
+        request_id = details.get("request_id")
+        actor = details.get("renter")
+        return (
+            int(copy_id) if copy_id is not None else None,
+            str(rental_id).lower() if rental_id else None,
+            str(request_id).lower() if request_id else None,
+            actor or None,
+        )
+
+    if not isinstance(details, str):
+        return None, None, None, None
+
+    copy_match = COPY_RE.search(details)
+    rental_match = RENTAL_RE.search(details)
+    name_match = NAME_RE.search(details) or ACTOR_RE.match(details.strip())
+
+    copy_id = int(copy_match.group(1)) if copy_match else None
+    rental_id = rental_match.group(1).lower() if rental_match else None
+    actor = name_match.group(1).strip() if name_match else None
+    return copy_id, rental_id, None, actor
+
+
+def to_record(row):
+    """logs 원본 행 → 파티션 레코드(타입 컬럼 포함)."""
+    copy_id, rental_id, request_id, actor = parse_details(row.get("details"))
+    game_id = row.get("game_id")
+    return {
+        "log_id": row["log_id"],
+        "game_id": int(game_id) if game_id is not None else None,
+        "user_id": row.get("user_id"),
+        "action_type": row.get("action_type"),
+        "copy_id": copy_id,
+        "rental_id": rental_id,
+        "request_id": request_id,
+        "actor": actor,
+        "details": row.get("details"),
+        "created_at": row["created_at"],
+    }
+
+
+def parse_timestamp(value):
+    # Python 3.10 이하의 fromisoformat은 '+00:00' 앞의 6자리 미만 소수초를 못 읽음 → 보정
+    match = re.match(r"^(.*T\d{2}:\d{2}:\d{2})(?:\.(\d+))?(.*)$", value)
+    if match:
+        base, frac, tz = match.groups()
+        frac = (frac or "0")[:6].ljust(6, "0")
+        value = f"{base}.{frac}{tz.replace('Z', '+00:00') or '+00:00'}"
+    return datetime.fromisoformat(value).astimezone(timezone.utc)
+
+
+def month_key(created_at):
+    return parse_timestamp(created_at).astimezone(KST).strftime("%Y-%m")
+
+
+def current_month():
+    return datetime.now(KST).strftime("%Y-%m")
+
+
+# ────────────────────────────────────────────
+# 파티션 입출력
+# ────────────────────────────────────────────
+
+def partition_path(archive_dir, month):
+    return os.path.join(archive_dir, f"{month}.jsonl.gz")
+
+
+def read_partition(archive_dir, month):
+    path = partition_path(archive_dir, month)
+    if not os.path.exists(path):
+        return []
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def write_partition(archive_dir, month, records):
+    """log_id 기준 중복 제거 + created_at 정렬 후 원자적으로 덮어씁니다."""
+    unique = {r["log_id"]: r for r in records}
+    ordered = sorted(unique.values(), key=lambda r: (parse_timestamp(r["created_at"]), r["log_id"]))
+
+    path = partition_path(archive_dir, month)
+    tmp_path = path + ".tmp"
+    # mtime=0 → 같은 내용이면 같은 바이트 (재실행해도 git diff가 생기지 않음)
+    with open(tmp_path, "wb") as raw:
+        with gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as gz:
+            for record in ordered:
+                line = json.dumps({c: record.get(c) for c in COLUMNS}, ensure_ascii=False)
+                gz.write((line + "\n").encode("utf-8"))
+    os.replace(tmp_path, path)
+    return ordered
+
+
+def list_partitions(archive_dir):
+    if not os.path.isdir(archive_dir):
+        return []
+    months = [
+        name[: -len(".jsonl.gz")]
+        for name in os.listdir(archive_dir)
+        if re.match(r"^\d{4}-\d{2}\.jsonl\.gz$", name)
+    ]
+    return sorted(months)
+
+
+# ────────────────────────────────────────────
+# 인덱스
+# ────────────────────────────────────────────
+
+def load_index(archive_dir):
+    path = os.path.join(archive_dir, INDEX_FILE)
+    if not os.path.exists(path):
+        return {"partitions": {}, "games": {}, "users": {}}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_index(archive_dir, index):
+    path = os.path.join(archive_dir, INDEX_FILE)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def index_partition(index, month, records):
+    """한 파티션의 통계와 game/user → 월 매핑을 인덱스에 반영합니다."""
+    # 기존 매핑에서 이 달을 먼저 제거 (재작성 시 stale 항목 방지)
+    for key in ("games", "users"):
+        for ident in list(index[key]):
+            months = [m for m in index[key][ident] if m != month]
+            if months:
+                index[key][ident] = months
+            else:
+                del index[key][ident]
+
+    if not records:
+        index["partitions"].pop(month, None)
+        return
+
+    index["partitions"][month] = {
+        "rows": len(records),
+        "first": records[0]["created_at"],
+        "last": records[-1]["created_at"],
+    }
+    for record in records:
+        if record["game_id"] is not None:
+            months = index["games"].setdefault(str(record["game_id"]), [])
+            if month not in months:
+                months.append(month)
+        if record["user_id"]:
+            months = index["users"].setdefault(record["user_id"], [])
+            if month not in months:
+                months.append(month)
+
+    for key in ("games", "users"):
+        for months in index[key].values():
+            months.sort()
+
+
+# ────────────────────────────────────────────
+# 입력 소스
+# ────────────────────────────────────────────
+
+def fetch_closed_logs(client, before_month):
+    """before_month(YYYY-MM) 1일 00:00 KST 이전의 logs를 페이지 단위로 가져옵니다."""
+    cutoff = f"{before_month}-01T00:00:00+09:00"
+    rows = []
+    offset = 0
+    while True:
+        res = (
+            client.table("logs")
+            .select("log_id, game_id, user_id, action_type, details, created_at")
+            .lt("created_at", cutoff)
+            .order("created_at")
+            .order("log_id")  # created_at은 중복 가능 → 페이지 경계에서 행이 밀리지 않도록 고정
+            .range(offset, offset + PAGE_SIZE - 1)
+            .execute()
+        )
+        rows.extend(res.data)
+        if len(res.data) < PAGE_SIZE:
+            return rows
+        offset += PAGE_SIZE
+
+
+def purge_logs(client, log_ids):
+    """보관된 log_id를 작은 묶음으로 삭제합니다. 삭제한 건수와 실패한 건수를 반환합니다.
+
+    파티션은 이미 기록(log_id 기준 중복 제거)되어 있으므로, 실패한 묶음은 다시 실행하면 됩니다.
+    """
+    deleted = 0
+    failed = 0
+    for i in range(0, len(log_ids), DELETE_CHUNK_SIZE):
+        chunk = log_ids[i:i + DELETE_CHUNK_SIZE]
+        try:
+            client.table("logs").delete().in_("log_id", chunk).execute()
+            deleted += len(chunk)
+        except Exception as e:
+            print(f"  - [Fail] 삭제 실패 ({i + 1}~{i + len(chunk)}번째, {len(chunk)}건): {e}")
+            failed += len(chunk)
+    return deleted, failed
+
+
+# ────────────────────────────────────────────
+# 명령
+# ────────────────────────────────────────────
+
+def merge_partition(archive_dir, month, incoming):
+    """기존 파티션에 신규 레코드를 병합해서 다시 씁니다. (병렬 실행 단위)"""
+    existing = read_partition(archive_dir, month)
+    merged = write_partition(archive_dir, month, existing + incoming)
+    return month, len(existing), merged
+
+
+def archive(rows, archive_dir, before_month, dry_run=False, jobs=1):
+    """마감된 달의 행을 파티션에 병합합니다. 보관된 log_id 목록을 반환합니다."""
+    by_month = {}
+    for row in rows:
+        month = month_key(row["created_at"])
+        if month < before_month:
+            by_month.setdefault(month, []).append(to_record(row))
+
+    if not by_month:
+        print("아카이브할 마감된 달의 로그가 없습니다.")
+        return []
+
+    archived_ids = [r["log_id"] for month in sorted(by_month) for r in by_month[month]]
+    if dry_run:
+        for month in sorted(by_month):
+            existing = len(read_partition(archive_dir, month))
+            print(f"[{month}] 신규 {len(by_month[month])}건 / 기존 {existing}건")
+        return archived_ids
+
+    os.makedirs(archive_dir, exist_ok=True)
+    index = load_index(archive_dir)
+
+    # 파티션은 서로 독립 → 병렬로 쓰고, 인덱스는 한 스레드에서 갱신
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        results = pool.map(lambda m: merge_partition(archive_dir, m, by_month[m]), sorted(by_month))
+        for month, existing, merged in results:
+            print(f"[{month}] 신규 {len(by_month[month])}건 / 기존 {existing}건")
+            index_partition(index, month, merged)
+
+    save_index(archive_dir, index)
+    return archived_ids
+
+
+def regroup_partition(archive_dir, month):
+    """파티션을 읽어 최신 파서로 다시 파싱하고, (한국 시간 기준) 달별로 나눕니다."""
+    by_month = {}
+    records = read_partition(archive_dir, month)
+    for record in records:
+        by_month.setdefault(month_key(record["created_at"]), []).append(to_record(record))
+    return month, len(records), by_month
+
+
+def compact(archive_dir, dry_run=False, jobs=1):
+    """모든 파티션을 다시 써서 중복을 제거하고 인덱스를 새로 만듭니다.
+
+    예전 버전(UTC 월 기준)으로 만든 파티션의 레코드도 올바른 달로 옮깁니다.
+    """
+    months = list_partitions(archive_dir)
+    by_month = {}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for month, count, groups in pool.map(lambda m: regroup_partition(archive_dir, m), months):
+            moved = count - len(groups.get(month, []))
+            print(f"[{month}] {count}건" + (f" (다른 달로 이동 {moved}건)" if moved else ""))
+            for target, records in groups.items():
+                by_month.setdefault(target, []).extend(records)
+
+    if dry_run:
+        for month in sorted(by_month):
+            print(f"[{month}] → {len({r['log_id'] for r in by_month[month]})}건")
+        return
+
+    index = {"partitions": {}, "games": {}, "users": {}}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        targets = sorted(by_month)
+        for month, merged in zip(targets, pool.map(lambda m: write_partition(archive_dir, m, by_month[m]), targets)):
+            print(f"[{month}] → {len(merged)}건")
+            index_partition(index, month, merged)
+
+    # 레코드가 모두 다른 달로 옮겨진 파티션은 삭제
+    for month in months:
+        if month not in by_month:
+            os.remove(partition_path(archive_dir, month))
+    save_index(archive_dir, index)
+
+
+def lookup(archive_dir, game_id=None, user_id=None):
+    """인덱스로 필요한 파티션만 읽어 game/user 조건에 맞는 레코드를 반환합니다."""
+    index = load_index(archive_dir)
+    candidates = None
+    if game_id is not None:
+        candidates = set(index["games"].get(str(game_id), []))
+    if user_id is not None:
+        months = set(index["users"].get(user_id, []))
+        candidates = months if candidates is None else candidates & months
+    if candidates is None:
+        candidates = set(index["partitions"])
+
+    results = []
+    for month in sorted(candidates):
+        for record in read_partition(archive_dir, month):
+            if game_id is not None and record["game_id"] != game_id:
+                continue
+            if user_id is not None and record["user_id"] != user_id:
+                continue
+            results.append(record)
+    return results
+
+
+def add_arguments(parser):
+    parser.add_argument("--archive-dir", default=DEFAULT_ARCHIVE_DIR, help="파티션 저장 경로")
+    sub = parser.add_subparsers(dest="action", metavar="ACTION")
+    sub.required = True
+
+    p_archive = sub.add_parser("archive", help="마감된 달의 logs를 파티션으로 이동")
+    source = p_archive.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", help="backup_supabase.js 가 만든 logs.json 경로")
+    source.add_argument("--from-db", action="store_true", help="Supabase에서 직접 조회")
+    p_archive.add_argument("--before", default=None, help="이 달(YYYY-MM) 이전만 보관 (기본: 이번 달)")
+    p_archive.add_argument("--purge", action="store_true", help="보관 후 DB에서 삭제 (--from-db 전용)")
+
+    p_compact = sub.add_parser("compact", help="파티션 중복 제거 및 인덱스 재생성")
+
+    p_lookup = sub.add_parser("lookup", help="game/user 기준으로 보관된 로그 조회")
+    p_lookup.add_argument("--game", type=int, default=None)
+    p_lookup.add_argument("--user", default=None)
+
+    for p in (p_archive, p_compact, p_lookup):
+        tool_config.add_common_arguments(p, nested=True)
+
+
+def run(args, config):
+    if args.action == "archive":
+        before = args.before or current_month()
+        try:
+            # '2026-13' 같은 값 거부, '2026-3' → '2026-03' 으로 정규화
+            before = datetime.strptime(before, "%Y-%m").strftime("%Y-%m")
+        except ValueError:
+            before = None
+        if before is None or before > current_month():
+            raise SystemExit(f"--before 값이 올바르지 않습니다: {args.before} (YYYY-MM, 이번 달 이하)")
+        if args.purge and not args.from_db:
+            raise SystemExit("--purge 는 --from-db 와 함께 사용해야 합니다.")
+
+        client = None
+        if args.from_db:
+            # 삭제까지 하므로 RLS 우회를 위해 service role 사용
+            client = config.supabase(service_role=True)
+            rows = fetch_closed_logs(client, before)
+        else:
+            with open(args.input, "r", encoding="utf-8") as f:
+                rows = json.load(f)
+
+        archived_ids = archive(rows, args.archive_dir, before, dry_run=args.dry_run, jobs=args.jobs)
+        print(f"보관 대상: {len(archived_ids)}건")
+
+        if args.purge and archived_ids:
+            if args.dry_run:
+                print(f"[dry-run] DB에서 {len(archived_ids)}건 삭제 예정")
+            else:
+                deleted, failed = purge_logs(client, archived_ids)
+                print(f"DB에서 {deleted}건 삭제 완료")
+                if failed:
+                    print(f"삭제 실패 {failed}건 → 같은 명령을 다시 실행하세요. (이미 보관된 행은 중복 저장되지 않음)")
+                    return 1
+
+    elif args.action == "compact":
+        compact(args.archive_dir, dry_run=args.dry_run, jobs=args.jobs)
+
+    elif args.action == "lookup":
+        for record in lookup(args.archive_dir, game_id=args.game, user_id=args.user):
+            print(json.dumps(record, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(tool_config.standalone("logs 월 단위 아카이브 / 컴팩션 도구", add_arguments, run))
@@ -0,0 +1,124 @@
+"""
+덜지니어스 Python 유지보수 도구 통합 CLI
+
+각 하위 명령의 모듈(및 supabase / playwright / requests 같은 의존성)은
+해당 명령을 실행할 때만 import 합니다. --help, config 등은 바로 끝납니다.
+
+사용 예:
+    python scripts/dullg.py --help
+    python scripts/dullg.py migrate-images --dry-run --jobs 8
+    python scripts/dullg.py fetch-youtube --headless --jobs 2
+    python scripts/dullg.py archive-logs archive --from-db --purge
+
+cron 예 (매월 1일 04:00, 지난달 logs 보관 / 월 경계는 한국 시간 기준):
+    0 4 1 * * cd /path/to/repo && mkdir -p logs && python3 scripts/dullg.py archive-logs archive --from-db --purge >> logs/archive.log 2>&1
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+
+import tool_config
+
+
+# 명령 이름 → (모듈 파일 경로(루트 기준), 도움말)
+COMMANDS = {
+    "migrate-images": ("scripts/migrate_images.py", "게임 이미지를 Supabase Storage로 이관"),
+    "fetch-youtube": ("scripts/fetch_youtube_urls.py", "video_url 없는 게임의 유튜브 설명 영상 수집"),
+    "gen-sql": ("scripts/generate_thumbnail_update_sql.py", "CSV → 썸네일 일괄 업데이트 SQL 생성"),
+    "archive-logs": ("scripts/archive_logs.py", "logs 월 단위 아카이브 / 컴팩션 / 조회"),
+    "process-logs": ("archive/migration_scripts/process_logs.py", "구 시트 Logs CSV → rentals / 조회수 통계"),
+    "process-reviews": ("archive/migration_scripts/process_reviews.py", "구 시트 Reviews CSV → reviews 시드"),
+    "process-users": ("archive/migration_scripts/process_users.py", "구 시트 Users CSV → allowed_users 시드"),
+    "remap-ids": ("archive/migration_scripts/process_all_files.py", "게임 ID 재부여 후 rentals / reviews 참조 갱신"),
+}
+
+# 명령 실행 시점에 import 하는 외부 의존성 → 설치 명령
+INSTALL_HINTS = {
+    "supabase": "pip install supabase",
+    "requests": "pip install requests",
+    "playwright": "pip install playwright && playwright install chromium",
+}
+
+
+def load_command(name):
+    """명령 모듈을 파일 경로로 불러옵니다. (이 시점에만 import 비용 발생)"""
+    relative_path, _ = COMMANDS[name]
+    path = os.path.join(tool_config.ROOT_DIR, relative_path)
+    module_name = "dullg_" + name.replace("-", "_")
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def cmd_config(args, config):
+    """설정 확인용 (키 값은 앞부분만 표시)."""
+    print(f"설정 파일: {', '.join(config.sources) or '(없음)'}")
+    print(f"SUPABASE_URL: {config.supabase_url or '(없음)'}")
+    key = config.supabase_key
+    print(f"SUPABASE_KEY: {key[:10] + '...' if key else '(없음)'}")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="dullg",
+        description="덜지니어스 Python 유지보수 도구",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="공통 옵션: --env-file PATH, --dry-run, --jobs N (각 명령 뒤에 지정)",
+    )
+    sub = parser.add_subparsers(dest="command", metavar="COMMAND")
+    sub.required = True
+
+    subparsers = {}
+    for name, (_, help_text) in COMMANDS.items():
+        subparsers[name] = sub.add_parser(name, help=help_text, description=help_text)
+
+    p_config = sub.add_parser("config", help="불러온 설정 확인")
+    subparsers["config"] = p_config
+
+    for p in subparsers.values():
+        tool_config.add_common_arguments(p)
+    return parser, subparsers
+
+
+def find_command(argv):
+    for token in argv:
+        if token in COMMANDS or token == "config":
+            return token
+        if not token.startswith("-"):
+            return None
+    return None
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    parser, subparsers = build_parser()
+
+    # 선택된 명령의 모듈만 불러와서 전용 옵션을 등록
+    name = find_command(argv)
+    module = None
+    if name in COMMANDS:
+        module = load_command(name)
+        module.add_arguments(subparsers[name])
+
+    args = parser.parse_args(argv)
+    config = tool_config.Config(args.env_file)
+    if args.command == "config":
+        return cmd_config(args, config)
+    try:
+        return module.run(args, config) or 0
+    except ModuleNotFoundError as e:
+        # 외부 의존성만 설치 안내, 그 외(오타 / 로컬 모듈 누락)는 그대로 에러
+        if e.name not in INSTALL_HINTS:
+            raise
+        print(f"필요한 라이브러리가 없습니다: {e.name}")
+        print(INSTALL_HINTS[e.name])
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,50 +1,62 @@
 
 import csv
 import os
+import sys
 
-# 파일 경로 설정 (사용자 환경 기준 절대 경로)
-CSV_FILE_PATH = r"c:\Users\USER\Desktop\OSS\BoardGameRent\dullgboardgamerent\archive\DullG_BoardGame_Rental - Games (2).csv"
-OUTPUT_SQL_PATH = r"c:\Users\USER\Desktop\OSS\BoardGameRent\dullgboardgamerent\database\update_thumbnails.sql"
+import tool_config
 
-def generate_sql():
+# 파일 경로 설정 (저장소 루트 기준, 옵션으로 변경 가능)
+CSV_FILE_PATH = os.path.join(tool_config.ROOT_DIR, "archive", "DullG_BoardGame_Rental - Games (2).csv")
+OUTPUT_SQL_PATH = os.path.join(tool_config.ROOT_DIR, "database", "update_thumbnails.sql")
+
+
+def add_arguments(parser):
+    parser.add_argument("--csv", default=CSV_FILE_PATH, help="게임 CSV 경로 (id, image 컬럼)")
+    parser.add_argument("--output", default=OUTPUT_SQL_PATH, help="생성할 SQL 파일 경로")
+
+
+def run(args, config):
     # SQL 파일 시작
     sql_statements = ["-- 보드게임 썸네일 일괄 업데이트 SQL", "BEGIN;"]
-    
+
     try:
-        with open(CSV_FILE_PATH, mode='r', encoding='utf-8') as csvfile:
+        with open(args.csv, mode='r', encoding='utf-8') as csvfile:
             reader = csv.DictReader(csvfile)
-            
+
             count = 0
             for row in reader:
                 game_id = row.get('id')
                 image_url = row.get('image')
-                
+
                 # ID와 이미지 URL이 모두 존재할 때만 업데이트 구문 생성
                 if game_id and image_url and image_url.strip():
                     # SQL Injection 방지를 위해 간단히 이스케이프 (싱글 따옴표 처리)
                     safe_url = image_url.replace("'", "''")
-                    
+
                     sql = f"UPDATE public.games SET image = '{safe_url}' WHERE id = {game_id};"
                     sql_statements.append(sql)
                     count += 1
-                    
+
             print(f"총 {count}개의 업데이트 구문을 생성했습니다.")
-            
+
     except FileNotFoundError:
-        print(f"오류: CSV 파일을 찾을 수 없습니다: {CSV_FILE_PATH}")
-        return
-    except Exception as e:
-        print(f"오류 발생: {e}")
-        return
+        print(f"오류: CSV 파일을 찾을 수 없습니다: {args.csv}")
+        return 1
 
     # 트랜잭션 커밋
     sql_statements.append("COMMIT;")
 
+    if args.dry_run:
+        print(f"[dry-run] {args.output} 저장 생략")
+        return 0
+
     # SQL 파일 저장
-    with open(OUTPUT_SQL_PATH, mode='w', encoding='utf-8') as sqlfile:
+    with open(args.output, mode='w', encoding='utf-8') as sqlfile:
         sqlfile.write('\n'.join(sql_statements))
-    
-    print(f"SQL 파일이 생성되었습니다: {OUTPUT_SQL_PATH}")
+
+    print(f"SQL 파일이 생성되었습니다: {args.output}")
+    return 0
+
 
 if __name__ == "__main__":
-    generate_sql()
+    sys.exit(tool_config.standalone("썸네일 일괄 업데이트 SQL 생성", add_arguments, run))
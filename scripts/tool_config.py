@@ -0,0 +1,127 @@
+"""
+Python 유지보수 도구 공용 설정
+
+- 설정은 환경 변수 → --env-file → .env.local → .env 순서로 찾습니다. (input() 프롬프트 없음)
+- 표준 라이브러리만 import 합니다. supabase 등 무거운 모듈은 실제로 필요할 때 불러옵니다.
+"""
+
+import argparse
+import os
+import sys
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+DEFAULT_ENV_FILES = [".env.local", ".env"]
+
+URL_KEYS = ["SUPABASE_URL", "VITE_SUPABASE_URL", "REACT_APP_SUPABASE_URL"]
+SERVICE_KEYS = ["SUPABASE_SERVICE_ROLE_KEY", "VITE_SUPABASE_SERVICE_ROLE_KEY"]
+ANON_KEYS = ["VITE_SUPABASE_ANON_KEY", "REACT_APP_SUPABASE_ANON_KEY"]
+
+
+def read_env_file(path):
+    """KEY=VALUE 형식의 파일을 dict로 읽습니다. 주석/빈 줄은 무시."""
+    values = {}
+    with open(path, "r", encoding="utf-8-sig") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("export "):
+                line = line[len("export "):]
+            key, sep, value = line.partition("=")
+            if sep and key.strip():
+                values[key.strip()] = value.strip().strip("'\"")
+    return values
+
+
+class Config:
+    """도구 실행에 필요한 설정값. os.environ 이 파일 값보다 우선합니다."""
+
+    def __init__(self, env_file=None):
+        self.values = {}
+        self.sources = []
+
+        path = env_file or os.getenv("DULLG_ENV_FILE")
+        if path:
+            if not os.path.exists(path):
+                raise SystemExit(f"설정 파일을 찾을 수 없습니다: {path}")
+            candidates = [path]
+        else:
+            candidates = [os.path.join(ROOT_DIR, name) for name in DEFAULT_ENV_FILES]
+
+        # 앞쪽 파일이 우선 → 뒤에서부터 덮어쓰기
+        for candidate in reversed(candidates):
+            if os.path.exists(candidate):
+                self.values.update(read_env_file(candidate))
+                self.sources.insert(0, candidate)
+        self.values.update(os.environ)
+        self._clients = {}
+
+    def get(self, *keys, default=None):
+        for key in keys:
+            value = self.values.get(key)
+            if value:
+                return value
+        return default
+
+    def require(self, *keys):
+        value = self.get(*keys)
+        if not value:
+            raise SystemExit(f"설정값 없음: {' / '.join(keys)} (환경 변수 또는 .env.local 확인)")
+        return value
+
+    @property
+    def supabase_url(self):
+        return self.get(*URL_KEYS)
+
+    @property
+    def supabase_key(self):
+        return self.get(*SERVICE_KEYS) or self.get(*ANON_KEYS)
+
+    def supabase(self, service_role=False):
+        """Supabase 클라이언트 (최초 호출 시 생성).
+
+        DB 수정/스토리지 업로드는 service role 권장, service_role=False 면 anon key도 허용.
+        """
+        if service_role not in self._clients:
+            from supabase import create_client  # 무거운 import → 필요할 때만
+
+            url = self.require(*URL_KEYS)
+            key = self.require(*SERVICE_KEYS) if service_role else self.require(*(SERVICE_KEYS + ANON_KEYS))
+            self._clients[service_role] = create_client(url, key)
+        return self._clients[service_role]
+
+
+def add_common_arguments(parser, nested=False):
+    """모든 하위 명령이 공유하는 옵션.
+
+    nested=True: 2단계 하위 명령(archive-logs compact 등)용. 기본값을 두지 않아야
+    상위 파서에서 받은 값을 덮어쓰지 않습니다.
+    """
+    defaults = {"env_file": None, "dry_run": False, "jobs": 1}
+    if nested:
+        defaults = dict.fromkeys(defaults, argparse.SUPPRESS)
+    parser.add_argument("--env-file", default=defaults["env_file"], help="설정 파일 경로 (기본: .env.local, .env)")
+    parser.add_argument("--dry-run", action="store_true", default=defaults["dry_run"],
+                        help="파일/DB를 변경하지 않고 결과만 출력")
+    parser.add_argument("--jobs", "-j", type=positive_int, default=defaults["jobs"], metavar="N",
+                        help="동시 작업 수 (기본: 1)")
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("1 이상의 정수여야 합니다.")
+    return number
+
+
+def standalone(description, add_arguments, run, argv=None):
+    """개별 스크립트를 직접 실행할 때 dullg.py 와 같은 옵션으로 실행합니다."""
+    parser = argparse.ArgumentParser(description=description)
+    add_common_arguments(parser)
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    return run(args, Config(args.env_file)) or 0
+
+
+if __name__ == "__main__":
+    sys.exit("직접 실행하지 말고 scripts/dullg.py 를 사용하세요.")